@@ -28,17 +28,27 @@ License: GPL-3.0-or-later
 """
 
 import argparse
+import errno
 import json
 import os
 import re
 import shutil
+import stat
 import sys
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-RE_MCGCP_DIR = re.compile(r"^(?P<gameid>[A-Z0-9]{4})0100$")
-RE_GCMCE_DIR = re.compile(r"^DL-DOL-(?P<gameid>[A-Z0-9]{4})-(?P<region3>[A-Z]{3})$")
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
+# Both layouts in one pattern so a single match classifies an entry.
+RE_ANY_DIR = re.compile(
+    r"^(?:(?P<mcgcp>[A-Z0-9]{4})0100|DL-DOL-(?P<gcmce>[A-Z0-9]{4})-(?P<region3>[A-Z]{3}))$"
+)
 
 # Region mapping defaults (override with --region-map-json)
 DEFAULT_REGION3_FROM_LETTER = {
@@ -65,9 +75,19 @@ DEFAULT_LETTER_FROM_REGION3 = {
     "ESP": "S",
     "OTH": "X",
 }
+# Normalised (upper-case) copies, built once; load_region_map merges overrides on top
+_L2R = {k.upper(): v.upper() for k, v in DEFAULT_REGION3_FROM_LETTER.items()}
+_R2L = {k.upper(): v.upper() for k, v in DEFAULT_LETTER_FROM_REGION3.items()}
+
+# Buffer size for the read/write fallback copy, and per-call cap for kernel copies
+COPY_BUFSIZE = 1024 * 1024
+KERNEL_COPY_CHUNK = 1 << 30
+# errnos meaning "this copy primitive is unsupported here", not a real I/O failure
+_COPY_FALLBACK_ERRNOS = frozenset(
+    (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK, errno.EBADF, errno.ENOTTY)
+)
 
-@dataclass
-class PlanItem:
+class PlanItem(NamedTuple):
     src_dir: Path
     src_file: Path
     dst_dir: Path
@@ -81,143 +101,354 @@ def log(msg: str, verbose: bool) -> None:
 
 def load_region_map(path: Optional[Path]) -> Tuple[Dict[str, str], Dict[str, str]]:
     if not path:
-        return DEFAULT_REGION3_FROM_LETTER.copy(), DEFAULT_LETTER_FROM_REGION3.copy()
+        return dict(_L2R), dict(_R2L)
     with path.open("r", encoding="utf-8") as f:
         data = json.load(f)
-    l2r = DEFAULT_REGION3_FROM_LETTER.copy()
-    r2l = DEFAULT_LETTER_FROM_REGION3.copy()
-    for k, v in (data.get("letter_to_region3") or {}).items():
-        l2r[k.upper()] = v.upper()
-    for k, v in (data.get("region3_to_letter") or {}).items():
-        r2l[k.upper()] = v.upper()
-    return l2r, r2l
-
-def scan_mcgcp(memorycards_dir: Path) -> List[Tuple[Path, Path, str]]:
-    """Return (dir, file, gameid) for MCGCP entries."""
-    results: List[Tuple[Path, Path, str]] = []
-    if not memorycards_dir.exists():
-        return results
-    for entry in memorycards_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        m = RE_MCGCP_DIR.match(entry.name)
-        if not m:
-            continue
-        gameid = m.group("gameid")
-        raw = entry / f"{entry.name}-1.raw"
-        if raw.exists():
-            results.append((entry, raw, gameid))
-    return results
-
-def scan_gcmce(gc_dir: Path) -> List[Tuple[Path, Path, str, str]]:
-    """Return (dir, file, gameid, region3) for GCMCE entries."""
-    results: List[Tuple[Path, Path, str, str]] = []
-    if not gc_dir.exists():
-        return results
-    for entry in gc_dir.iterdir():
-        if not entry.is_dir():
+    l2r = {k.upper(): v.upper() for k, v in (data.get("letter_to_region3") or {}).items()}
+    r2l = {k.upper(): v.upper() for k, v in (data.get("region3_to_letter") or {}).items()}
+    return {**_L2R, **l2r}, {**_R2L, **r2l}
+
+def scan_any(cards_dir: Path) -> Iterator[Tuple[str, str, Optional[str], os.DirEntry]]:
+    """Yield (kind, gameid, region3, entry) for MCGCP/GCMCE dirs; region3 is None for MCGCP."""
+    match = RE_ANY_DIR.match  # bound once for the loop
+    try:
+        it = os.scandir(cards_dir)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            # Match on the bare name first; most entries on an SD root are noise.
+            # Length/affix checks reject those before the regex engine runs.
+            name = entry.name
+            n = len(name)
+            if not ((n == 8 and name.endswith("0100")) or (n == 15 and name.startswith("DL-DOL-"))):
+                continue
+            m = match(name)
+            if not m or not entry.is_dir(follow_symlinks=False):
+                continue
+            gameid = m.group("mcgcp")
+            if gameid:
+                yield "mcgcp", gameid, None, entry
+            else:
+                yield "gcmce", m.group("gcmce"), m.group("region3"), entry
+
+def scan_mcgcp(memorycards_dir: Path, check_files: bool = True) -> Iterator[Tuple[Path, Path, str]]:
+    """Yield (dir, file, gameid) for MCGCP entries; check_files=False skips the -1.raw lstat."""
+    for kind, gameid, _, entry in scan_any(memorycards_dir):
+        if kind != "mcgcp":
             continue
-        m = RE_GCMCE_DIR.match(entry.name)
-        if not m:
+        raw = entry.path + os.sep + entry.name + "-1.raw"
+        if not check_files or os.path.lexists(raw):
+            yield Path(entry.path), Path(raw), gameid
+
+def scan_gcmce(gc_dir: Path, check_files: bool = True) -> Iterator[Tuple[Path, Path, str, str]]:
+    """Yield (dir, file, gameid, region3) for GCMCE entries; check_files=False skips the -1.raw lstat."""
+    for kind, gameid, region3, entry in scan_any(gc_dir):
+        if kind != "gcmce":
             continue
-        gameid = m.group("gameid")
-        region3 = m.group("region3")
-        raw = entry / f"{entry.name}-1.raw"
-        if raw.exists():
-            results.append((entry, raw, gameid, region3))
-    return results
-
-def plan_mcgcp_to_gcmce(sd_root: Path, out_root: Path, l2r: Dict[str, str], copy_mode: bool) -> List[PlanItem]:
+        raw = entry.path + os.sep + entry.name + "-1.raw"
+        if not check_files or os.path.lexists(raw):
+            yield Path(entry.path), Path(raw), gameid, region3
+
+def _region_lut(l2r: Dict[str, str]) -> List[str]:
+    """256-entry table mapping ord(letter) -> REGION3 (either case); unmapped -> "OTH"."""
+    lut = ["OTH"] * 256
+    for k, v in l2r.items():
+        if len(k) == 1 and ord(k) < 256:
+            lut[ord(k)] = v
+            lut[ord(k.lower())] = v
+    return lut
+
+def plan_mcgcp_to_gcmce(
+    sd_root: Path, out_root: Path, l2r: Dict[str, str], copy_mode: bool, check_files: bool = True
+) -> Iterator[PlanItem]:
     src_root = sd_root / "MemoryCards"
     dst_root = out_root / "MemoryCards" / "GC"
-    plan: List[PlanItem] = []
-    for src_dir, src_file, gameid in scan_mcgcp(src_root):
-        region_letter = gameid[-1]  # 4th char
-        region3 = l2r.get(region_letter.upper(), "OTH")
+    lut = _region_lut(l2r)
+    for src_dir, src_file, gameid in scan_mcgcp(src_root, check_files):
+        region3 = lut[ord(gameid[3])]  # region letter is the 4th char
         dst_dir_name = f"DL-DOL-{gameid}-{region3}"
         dst_dir = dst_root / dst_dir_name
         dst_file = dst_dir / f"{dst_dir_name}-1.raw"
-        plan.append(
-            PlanItem(
-                src_dir=src_dir,
-                src_file=src_file,
-                dst_dir=dst_dir,
-                dst_file=dst_file,
-                action="copy" if copy_mode else "move",
-                reason=f"MCGCP→GCMCE {gameid} -> {dst_dir_name}",
-            )
+        yield PlanItem(
+            src_dir=src_dir,
+            src_file=src_file,
+            dst_dir=dst_dir,
+            dst_file=dst_file,
+            action="copy" if copy_mode else "move",
+            reason=f"MCGCP→GCMCE {gameid} -> {dst_dir_name}",
         )
-    return plan
 
-def plan_gcmce_to_mcgcp(sd_root: Path, out_root: Path, r2l: Dict[str, str], copy_mode: bool) -> List[PlanItem]:
+def plan_gcmce_to_mcgcp(
+    sd_root: Path, out_root: Path, r2l: Dict[str, str], copy_mode: bool, check_files: bool = True
+) -> Iterator[PlanItem]:
     src_root = sd_root / "MemoryCards" / "GC"
     dst_root = out_root / "MemoryCards"
-    plan: List[PlanItem] = []
-    for src_dir, src_file, gameid, region3 in scan_gcmce(src_root):
+    for src_dir, src_file, gameid, region3 in scan_gcmce(src_root, check_files):
         # Trust GAMEID as-is; MCGCP just uses {GAMEID}0100
         mcgcp_dirname = f"{gameid}0100"
         dst_dir = dst_root / mcgcp_dirname
         dst_file = dst_dir / f"{mcgcp_dirname}-1.raw"
-        plan.append(
-            PlanItem(
-                src_dir=src_dir,
-                src_file=src_file,
-                dst_dir=dst_dir,
-                dst_file=dst_file,
-                action="copy" if copy_mode else "move",
-                reason=f"GCMCE→MCGCP DL-DOL-{gameid}-{region3} -> {mcgcp_dirname}",
-            )
+        yield PlanItem(
+            src_dir=src_dir,
+            src_file=src_file,
+            dst_dir=dst_dir,
+            dst_file=dst_file,
+            action="copy" if copy_mode else "move",
+            reason=f"GCMCE→MCGCP DL-DOL-{gameid}-{region3} -> {mcgcp_dirname}",
         )
-    return plan
 
-def print_plan(plan: List[PlanItem]) -> None:
-    print("Planned operations:")
-    for p in plan:
-        print(f"  {p.action.upper()}: {p.src_file}  ->  {p.dst_file}   ({p.reason})")
-    print(f"Total items: {len(plan)}")
+def _plan_line(p: PlanItem) -> str:
+    return f"  {p.action.upper()}: {p.src_file}  ->  {p.dst_file}   ({p.reason})"
 
-def safe_copy(src: Path, dst: Path, overwrite: bool) -> None:
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.exists():
-        if overwrite:
-            if dst.is_dir():
-                shutil.rmtree(dst)
+def print_plan(plan: List[PlanItem], files_checked: bool = True) -> None:
+    if files_checked:
+        lines = ["Planned operations:\n"]
+    else:
+        lines = ["Planned operations (-1.raw files not verified; add --verbose to check):\n"]
+    lines.extend(_plan_line(p) + "\n" for p in plan)
+    lines.append(f"Total items: {len(plan)}\n")
+    sys.stdout.writelines(lines)
+
+def _try_reflink(infd: int, outfd: int) -> bool:
+    """Clone infd into outfd with FICLONE (btrfs/XFS); False if not possible here."""
+    if fcntl is None or not hasattr(fcntl, "FICLONE"):
+        return False
+    try:
+        fcntl.ioctl(outfd, fcntl.FICLONE, infd)
+    except OSError as e:
+        if e.errno in _COPY_FALLBACK_ERRNOS:
+            return False
+        raise
+    return True
+
+def _kernel_copy(infd: int, outfd: int, use_sendfile: bool) -> bool:
+    """Copy infd -> outfd in-kernel; False if unsupported before any byte moved.
+
+    Some FUSE/network filesystems return 0 instead of an error when they can't do the copy,
+    so a zero on the first call means "unsupported", not EOF; otherwise copy up to st_size.
+    """
+    size = os.fstat(infd).st_size
+    copied = 0
+    while copied < size:
+        try:
+            if use_sendfile:
+                n = os.sendfile(outfd, infd, copied, KERNEL_COPY_CHUNK)
             else:
-                dst.unlink()
-        else:
-            raise FileExistsError(f"Destination exists: {dst}")
-    shutil.copy2(src, dst)
+                n = os.copy_file_range(infd, outfd, KERNEL_COPY_CHUNK)
+        except OSError as e:
+            if copied == 0 and e.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            if copied == 0:
+                return False
+            break  # source shrank underneath us
+        copied += n
+    return True
+
+def _copy_file_data(src: Path, dst: Path, exclusive: bool = False) -> None:
+    """Copy file contents: reflink, then copy_file_range, sendfile, and 1 MiB read/write.
+
+    With exclusive, dst is created with O_EXCL so a concurrent writer can't slip in between
+    the caller's existence check and the copy.
+    """
+    if sys.platform == "darwin":
+        if exclusive:
+            open(dst, "xb").close()
+        # shutil.copyfile already goes through fcopyfile(3) on macOS.
+        shutil.copyfile(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "xb" if exclusive else "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        if _try_reflink(infd, outfd):
+            return
+        if hasattr(os, "copy_file_range") and _kernel_copy(infd, outfd, use_sendfile=False):
+            return
+        if hasattr(os, "sendfile") and _kernel_copy(infd, outfd, use_sendfile=True):
+            return
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while True:
+            buf = fsrc.read(COPY_BUFSIZE)
+            if not buf:
+                break
+            fdst.write(buf)
+
+def _clear_destination(dst: Path, overwrite: bool) -> None:
+    """Remove an existing dst if overwrite is set, else raise FileExistsError (one stat)."""
+    try:
+        st = os.stat(dst)
+    except FileNotFoundError:
+        return
+    if not overwrite:
+        raise FileExistsError(f"Destination exists: {dst}")
+    if stat.S_ISDIR(st.st_mode):
+        shutil.rmtree(dst)
+    else:
+        os.unlink(dst)
+
+def _clear_destination_at(rel: str, dir_fd: int, dst: Path, overwrite: bool) -> None:
+    """_clear_destination for rel under an open directory fd; dst is only used for messages."""
+    try:
+        st = os.stat(rel, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return
+    if not overwrite:
+        raise FileExistsError(f"Destination exists: {dst}")
+    if not stat.S_ISDIR(st.st_mode):
+        os.unlink(rel, dir_fd=dir_fd)
+    elif sys.version_info >= (3, 11):
+        shutil.rmtree(rel, dir_fd=dir_fd)
+    else:  # rmtree grew dir_fd in 3.11; a directory here is rare enough to take the long path
+        shutil.rmtree(dst)
+
+def safe_copy(src: Path, dst: Path, overwrite: bool) -> None:
+    """dst's parent directory must already exist."""
+    _clear_destination(dst, overwrite)
+    _copy_file_data(src, dst, exclusive=not overwrite)
+    shutil.copystat(src, dst)
 
 def safe_move(src: Path, dst: Path, overwrite: bool) -> None:
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.exists():
-        if overwrite:
-            if dst.is_dir():
-                shutil.rmtree(dst)
-            else:
-                dst.unlink()
-        else:
-            raise FileExistsError(f"Destination exists: {dst}")
+    """dst's parent directory must already exist."""
+    _clear_destination(dst, overwrite)
     src.replace(dst)
 
-def execute_plan(plan: List[PlanItem], overwrite: bool, dry_run: bool, verbose: bool) -> None:
-    for p in plan:
-        if dry_run:
+def _remove_if_empty(d: Path) -> None:
+    # rmdir itself refuses a non-empty dir, so no need to look inside first
+    try:
+        os.rmdir(d)
+    except OSError as e:
+        if e.errno not in (errno.ENOTEMPTY, errno.EEXIST, errno.ENOENT):
+            raise
+
+def execute_plan(plan: Iterable[PlanItem], overwrite: bool, dry_run: bool, verbose: bool) -> int:
+    """Run (or, with dry_run, echo) each plan item; return the item count.
+
+    Outside dry-run each operation is logged as it executes and the total is printed at the end.
+    """
+    if dry_run:
+        count = 0
+        for p in plan:
+            count += 1
             print(f"[DRY-RUN] {p.action.upper()} {p.src_file} -> {p.dst_file}")
-            continue
-        if p.action == "move":
+        return count
+
+    # All destination dirs are created up front, once each, so the plan must be known here
+    plan = list(plan)
+    for d in sorted({p.dst_dir for p in plan}, key=lambda d: len(d.parts)):
+        os.makedirs(d, exist_ok=True)
+
+    # Moves only happen in-place (cross-root runs are always copies), but MemoryCards/GC may
+    # still be a separate mount. Stat each distinct source/destination root once and pick the
+    # move strategy up front: rename within a filesystem, copy + unlink across.
+    moves = [p for p in plan if p.action == "move"]
+    roots = {p.src_dir.parent for p in moves} | {p.dst_dir.parent for p in moves}
+    cross_device = len({os.stat(d).st_dev for d in roots}) > 1
+    if cross_device:
+        print("WARNING: source and destination are on different filesystems; moving via copy + delete",
+              file=sys.stderr)
+
+    # For same-device moves, hold an fd on each destination root (the dst dirs' parent, normally
+    # just MemoryCards/ or MemoryCards/GC/) so the per-item stat/unlink/rename don't re-walk the
+    # full path. One fd per root rather than per dst dir keeps the count bounded on large cards.
+    # Filled in inside the try below so the finally always closes them.
+    root_fds: Dict[Path, int] = {}
+    use_root_fds = (
+        not cross_device
+        and hasattr(os, "O_DIRECTORY")
+        and {os.stat, os.unlink, os.rename} <= os.supports_dir_fd
+    )
+
+    def _copy(p: PlanItem) -> None:
+        safe_copy(p.src_file, p.dst_file, overwrite=overwrite)
+
+    def _move(p: PlanItem) -> None:
+        root_fd = root_fds.get(p.dst_dir.parent)
+        if root_fd is None:
             safe_move(p.src_file, p.dst_file, overwrite=overwrite)
-            # remove empty source dir
-            try:
-                next(p.src_dir.iterdir())
-            except StopIteration:
-                try:
-                    p.src_dir.rmdir()
-                except OSError:
-                    pass
         else:
-            safe_copy(p.src_file, p.dst_file, overwrite=overwrite)
-        log(f"OK: {p.action} {p.src_file} -> {p.dst_file}", verbose)
+            rel = os.path.join(p.dst_dir.name, p.dst_file.name)
+            _clear_destination_at(rel, root_fd, p.dst_file, overwrite)
+            # rename(2) replaces like Path.replace; only the short tail is resolved per call
+            os.rename(p.src_file, rel, dst_dir_fd=root_fd)
+        _remove_if_empty(p.src_dir)
+
+    def _move_across_devices(p: PlanItem) -> None:
+        safe_copy(p.src_file, p.dst_file, overwrite=overwrite)
+        p.src_file.unlink()
+        _remove_if_empty(p.src_dir)
+
+    move = _move_across_devices if cross_device else _move
+
+    # Copies are independent and I/O-bound, so overlap them; moves are cheap renames and stay
+    # serial. Copies sharing a dst_file (e.g. DL-DOL-GAFE-USA and DL-DOL-GAFE-EUR both -> GAFE0100)
+    # also run serially, in plan order, so collisions behave exactly as without the pool.
+    # Destination dirs already exist, so workers never race on mkdir.
+    copy_dsts = Counter(p.dst_file for p in plan if p.action == "copy")
+    pool = ThreadPoolExecutor(max_workers=4) if any(n == 1 for n in copy_dsts.values()) else None
+    pending = []
+
+    if plan:
+        print("Planned operations:")
+    try:
+        if use_root_fds:
+            for d in {p.dst_dir.parent for p in moves}:
+                root_fds[d] = os.open(d, os.O_RDONLY | os.O_DIRECTORY)
+        for p in plan:
+            print(_plan_line(p))
+            if p.action == "copy":
+                if pool is not None and copy_dsts[p.dst_file] == 1:
+                    pending.append((p, pool.submit(_copy, p)))
+                    continue
+                _copy(p)
+            else:
+                move(p)
+            log(f"OK: {p.action} {p.src_file} -> {p.dst_file}", verbose)
+        # Surface the first failure as soon as it happens, not when its turn in plan order comes
+        wait([fut for _, fut in pending], return_when=FIRST_EXCEPTION)
+        for _, fut in pending:
+            if fut.done() and fut.exception() is not None:
+                raise fut.exception()
+        for p, fut in pending:
+            fut.result()
+            log(f"OK: {p.action} {p.src_file} -> {p.dst_file}", verbose)
+    except BaseException:
+        # Abort on the first failure: drop copies that haven't started yet
+        for _, fut in pending:
+            fut.cancel()
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+        for fd in root_fds.values():
+            os.close(fd)
+    if plan:
+        print(f"Total items: {len(plan)}")
+    return len(plan)
+
+def _raise(e: OSError) -> None:
+    raise e
+
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """Like shutil.copytree(src, dst), but copies files concurrently through safe_copy."""
+    dirs: List[Tuple[str, str]] = []
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+        futures = []
+        # onerror re-raises: copytree fails on unreadable dirs, walk would silently skip them
+        for root, _, files in os.walk(src, onerror=_raise, followlinks=True):
+            target = str(dst) if root == str(src) else os.path.join(dst, os.path.relpath(root, src))
+            os.makedirs(target)  # raises if dst already exists, as copytree does
+            dirs.append((root, target))
+            for name in files:
+                futures.append(
+                    pool.submit(safe_copy, Path(root, name), Path(target, name), False)
+                )
+        for f in futures:
+            f.result()
+    # Directory times last, after all files have landed
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
 
 def do_backup(sd_root: Path, backup_dir: Path, overwrite: bool, dry_run: bool) -> None:
     src = sd_root / "MemoryCards"
@@ -231,7 +462,7 @@ def do_backup(sd_root: Path, backup_dir: Path, overwrite: bool, dry_run: bool) -
         else:
             dst.unlink()
     print(f"Backing up {src} -> {dst}")
-    shutil.copytree(src, dst)
+    _fast_copytree(src, dst)
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(
@@ -268,21 +499,29 @@ def main() -> int:
         backup_dir.mkdir(parents=True, exist_ok=True)
         do_backup(sd_root, backup_dir, overwrite=args.force, dry_run=args.dry_run)
 
-    # Build plan
+    # Build plan; a quiet dry-run only lists matching dirs and skips the per-file stat
+    check_files = not (args.dry_run and not args.verbose)
     if args.rename_to_gcmce:
-        plan = plan_mcgcp_to_gcmce(sd_root, out_root, l2r, copy_mode=copy_mode)
+        plan = plan_mcgcp_to_gcmce(sd_root, out_root, l2r, copy_mode=copy_mode, check_files=check_files)
     else:
-        plan = plan_gcmce_to_mcgcp(sd_root, out_root, r2l, copy_mode=copy_mode)
+        plan = plan_gcmce_to_mcgcp(sd_root, out_root, r2l, copy_mode=copy_mode, check_files=check_files)
 
-    if not plan:
-        print("No convertible entries found. Check source layout and flags.")
-        return 0
-
-    print_plan(plan)
-    if args.verbose:
-        print(f"Execute: overwrite={args.force} dry_run={args.dry_run} mode={'COPY' if copy_mode else 'MOVE'}")
-
-    execute_plan(plan, overwrite=args.force, dry_run=args.dry_run, verbose=args.verbose)
+    execute_msg = f"Execute: overwrite={args.force} dry_run={args.dry_run} mode={'COPY' if copy_mode else 'MOVE'}"
+    if args.dry_run:
+        plan = list(plan)
+        if not plan:
+            print("No convertible entries found. Check source layout and flags.")
+            return 0
+        print_plan(plan, files_checked=check_files)
+        log(execute_msg, args.verbose)
+        execute_plan(plan, overwrite=args.force, dry_run=True, verbose=args.verbose)
+    else:
+        # Scanning/planning is lazy, but execute_plan collects the whole plan (to create all
+        # destination dirs) before the first write, then logs each item as it executes it
+        log(execute_msg, args.verbose)
+        if not execute_plan(plan, overwrite=args.force, dry_run=False, verbose=args.verbose):
+            print("No convertible entries found. Check source layout and flags.")
+            return 0
     print("Done.")
     return 0
 